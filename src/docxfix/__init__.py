@@ -6,7 +6,7 @@ Creates docx fixtures with desirable characteristics for testing.
 
 __version__ = "0.1.0"
 
-from docxfix.generator import DocumentGenerator
+from docxfix.generator import DocumentGenerator, generate_many
 from docxfix.spec import (
     ChangeType,
     Comment,
@@ -37,5 +37,6 @@ __all__ = [
     "SectionSpec",
     "TrackedChange",
     "ValidationError",
+    "generate_many",
     "validate_docx",
 ]
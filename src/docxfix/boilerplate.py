@@ -10,11 +10,28 @@ from docxfix.constants import (
     FONT_TABLE_XML,
     NAMESPACES,
     SETTINGS_XML,
+    STATIC_TEXT_ID,
     THEME_XML_B64,
+    W14_PARA_ID,
+    W14_TEXT_ID,
+    W_AFTER,
+    W_ENDNOTES,
+    W_FOOTNOTES,
+    W_ID,
+    W_LINE,
+    W_LINE_RULE,
+    W_P,
+    W_PPR,
+    W_R,
+    W_SPACING,
+    W_TYPE,
     WEB_SETTINGS_XML,
 )
 from docxfix.spec import SectionSpec
-from docxfix.xml_utils import XMLElement
+from docxfix.xml_utils import XMLElement, xml_to_bytes
+
+# Namespace map shared by the footnotes and endnotes roots
+_NOTE_NSMAP = {"w": NAMESPACES["w"], "w14": NAMESPACES["w14"]}
 
 
 def create_settings(section_layout: list[SectionSpec]) -> bytes:
@@ -27,9 +44,7 @@ def create_settings(section_layout: list[SectionSpec]) -> bytes:
     )
     if has_even and root.find(f"{{{w_ns}}}evenAndOddHeaders") is None:
         root.insert(0, etree.Element(f"{{{w_ns}}}evenAndOddHeaders"))
-    return etree.tostring(
-        root, xml_declaration=True, encoding="UTF-8", pretty_print=False
-    )
+    return xml_to_bytes(root)
 
 
 def create_web_settings() -> bytes:
@@ -39,11 +54,9 @@ def create_web_settings() -> bytes:
 
 def create_footnotes(generate_hex_id) -> bytes:
     """Create word/footnotes.xml."""
-    w_ns = NAMESPACES["w"]
-    w14_ns = NAMESPACES["w14"]
     footnotes = etree.Element(
-        f"{{{w_ns}}}footnotes",
-        nsmap={"w": w_ns, "w14": w14_ns},
+        W_FOOTNOTES,
+        nsmap=_NOTE_NSMAP,
     )
     add_note_separator(
         footnotes, "footnote", "separator", "-1", generate_hex_id
@@ -51,18 +64,14 @@ def create_footnotes(generate_hex_id) -> bytes:
     add_note_separator(
         footnotes, "footnote", "continuationSeparator", "0", generate_hex_id
     )
-    return etree.tostring(
-        footnotes, xml_declaration=True, encoding="UTF-8", pretty_print=True
-    )
+    return xml_to_bytes(footnotes)
 
 
 def create_endnotes(generate_hex_id) -> bytes:
     """Create word/endnotes.xml."""
-    w_ns = NAMESPACES["w"]
-    w14_ns = NAMESPACES["w14"]
     endnotes = etree.Element(
-        f"{{{w_ns}}}endnotes",
-        nsmap={"w": w_ns, "w14": w14_ns},
+        W_ENDNOTES,
+        nsmap=_NOTE_NSMAP,
     )
     add_note_separator(
         endnotes, "endnote", "separator", "-1", generate_hex_id
@@ -70,9 +79,7 @@ def create_endnotes(generate_hex_id) -> bytes:
     add_note_separator(
         endnotes, "endnote", "continuationSeparator", "0", generate_hex_id
     )
-    return etree.tostring(
-        endnotes, xml_declaration=True, encoding="UTF-8", pretty_print=True
-    )
+    return xml_to_bytes(endnotes)
 
 
 def add_note_separator(
@@ -80,21 +87,21 @@ def add_note_separator(
 ) -> None:
     """Add a note separator entry for footnotes or endnotes."""
     w_ns = NAMESPACES["w"]
-    w14_ns = NAMESPACES["w14"]
     note = etree.SubElement(
-        parent,
-        f"{{{w_ns}}}{tag}",
-        {f"{{{w_ns}}}type": sep_tag, f"{{{w_ns}}}id": note_id},
+        parent, f"{{{w_ns}}}{tag}", {W_TYPE: sep_tag, W_ID: note_id}
+    )
+    para = etree.SubElement(
+        note,
+        W_P,
+        {W14_PARA_ID: generate_hex_id(8), W14_TEXT_ID: STATIC_TEXT_ID},
+    )
+    p_pr = etree.SubElement(para, W_PPR)
+    etree.SubElement(
+        p_pr,
+        W_SPACING,
+        {W_AFTER: "0", W_LINE: "240", W_LINE_RULE: "auto"},
     )
-    para = etree.SubElement(note, f"{{{w_ns}}}p")
-    para.set(f"{{{w14_ns}}}paraId", generate_hex_id(8))
-    para.set(f"{{{w14_ns}}}textId", "77777777")
-    p_pr = etree.SubElement(para, f"{{{w_ns}}}pPr")
-    spacing = etree.SubElement(p_pr, f"{{{w_ns}}}spacing")
-    spacing.set(f"{{{w_ns}}}after", "0")
-    spacing.set(f"{{{w_ns}}}line", "240")
-    spacing.set(f"{{{w_ns}}}lineRule", "auto")
-    run = etree.SubElement(para, f"{{{w_ns}}}r")
+    run = etree.SubElement(para, W_R)
     etree.SubElement(run, f"{{{w_ns}}}{sep_tag}")
 
 
@@ -115,7 +122,7 @@ def create_core_properties(
 ) -> bytes:
     """Create docProps/core.xml."""
     ts = timestamp or dt.datetime.now(dt.UTC)
-    now = ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = ts.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
     cp_ns = (
         "http://schemas.openxmlformats.org/package/"
         "2006/metadata/core-properties"
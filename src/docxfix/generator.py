@@ -1,8 +1,13 @@
 """Document generator for creating .docx files from specifications."""
 
+import copy
 import datetime as dt
+import functools
+import io
 import random
 import zipfile
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from lxml import etree
@@ -17,7 +22,27 @@ from docxfix.boilerplate import (
     create_theme,
     create_web_settings,
 )
-from docxfix.constants import NAMESPACES, WORD_NAMESPACES
+from docxfix.constants import (
+    MC_IGNORABLE,
+    MC_IGNORABLE_ATTR,
+    NAMESPACES,
+    PACKAGE_RELS_XML,
+    STATIC_TEXT_ID,
+    W14_PARA_ID,
+    W14_TEXT_ID,
+    W_BODY,
+    W_DOCUMENT,
+    W_ILVL,
+    W_NUMID,
+    W_NUMPR,
+    W_P,
+    W_PPR,
+    W_PSTYLE,
+    W_R,
+    W_T,
+    W_VAL,
+    WORD_NAMESPACES,
+)
 from docxfix.parts.comments import (
     add_paragraph_with_comments,
     create_comments,
@@ -41,7 +66,242 @@ from docxfix.spec import (
     Paragraph,
     SectionSpec,
 )
-from docxfix.xml_utils import XMLElement
+from docxfix.xml_utils import XMLElement, xml_to_bytes
+
+
+@functools.lru_cache(maxsize=32)
+def _build_content_types(
+    has_comments: bool,
+    has_numbering: bool,
+    section_overrides: tuple[tuple[str, str], ...],
+) -> bytes:
+    """Build [Content_Types].xml.
+
+    The result depends only on which optional parts are present, so it is
+    cached on those inputs.
+    """
+    types = etree.Element(
+        "Types",
+        xmlns=(
+            "http://schemas.openxmlformats.org/"
+            "package/2006/content-types"
+        ),
+    )
+    etree.SubElement(
+        types,
+        "Default",
+        Extension="rels",
+        ContentType=(
+            "application/vnd.openxmlformats-package"
+            ".relationships+xml"
+        ),
+    )
+    etree.SubElement(
+        types,
+        "Default",
+        Extension="xml",
+        ContentType="application/xml",
+    )
+    etree.SubElement(
+        types,
+        "Override",
+        PartName="/word/document.xml",
+        ContentType=(
+            "application/vnd.openxmlformats-officedocument."
+            "wordprocessingml.document.main+xml"
+        ),
+    )
+
+    if has_comments:
+        for part_name, suffix in (
+            ("/word/comments.xml", "comments"),
+            (
+                "/word/commentsExtended.xml",
+                "commentsExtended",
+            ),
+        ):
+            etree.SubElement(
+                types,
+                "Override",
+                PartName=part_name,
+                ContentType=(
+                    "application/vnd.openxmlformats"
+                    "-officedocument.wordprocessingml."
+                    f"{suffix}+xml"
+                ),
+            )
+
+    if has_numbering:
+        for part_name, suffix in (
+            ("/word/numbering.xml", "numbering"),
+            ("/word/styles.xml", "styles"),
+        ):
+            etree.SubElement(
+                types,
+                "Override",
+                PartName=part_name,
+                ContentType=(
+                    "application/vnd.openxmlformats"
+                    "-officedocument.wordprocessingml."
+                    f"{suffix}+xml"
+                ),
+            )
+
+    for part_name, content_type in section_overrides:
+        etree.SubElement(
+            types,
+            "Override",
+            PartName=part_name,
+            ContentType=content_type,
+        )
+
+    # Standard parts
+    standard_parts = [
+        ("/word/settings.xml", "settings"),
+        ("/word/webSettings.xml", "webSettings"),
+        ("/word/footnotes.xml", "footnotes"),
+        ("/word/endnotes.xml", "endnotes"),
+        ("/word/fontTable.xml", "fontTable"),
+    ]
+    for part_name, suffix in standard_parts:
+        etree.SubElement(
+            types,
+            "Override",
+            PartName=part_name,
+            ContentType=(
+                "application/vnd.openxmlformats"
+                "-officedocument.wordprocessingml."
+                f"{suffix}+xml"
+            ),
+        )
+
+    etree.SubElement(
+        types,
+        "Override",
+        PartName="/word/theme/theme1.xml",
+        ContentType=(
+            "application/vnd.openxmlformats-officedocument."
+            "theme+xml"
+        ),
+    )
+    etree.SubElement(
+        types,
+        "Override",
+        PartName="/docProps/core.xml",
+        ContentType=(
+            "application/vnd.openxmlformats-package"
+            ".core-properties+xml"
+        ),
+    )
+    etree.SubElement(
+        types,
+        "Override",
+        PartName="/docProps/app.xml",
+        ContentType=(
+            "application/vnd.openxmlformats-officedocument."
+            "extended-properties+xml"
+        ),
+    )
+
+    return xml_to_bytes(types)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_document_rels(
+    has_comments: bool,
+    has_numbering: bool,
+    section_rels: tuple[tuple[str, str], ...],
+) -> tuple[bytes, tuple[str, ...]]:
+    """Build word/_rels/document.xml.rels.
+
+    Returns the serialized part and the rIds assigned to ``section_rels``,
+    in order.
+    """
+    rel_base = (
+        "http://schemas.openxmlformats.org/"
+        "officeDocument/2006/relationships"
+    )
+    rels = etree.Element(
+        "Relationships",
+        xmlns=(
+            "http://schemas.openxmlformats.org/"
+            "package/2006/relationships"
+        ),
+    )
+
+    next_id = 1
+
+    if has_comments:
+        comment_rels = [
+            (f"{rel_base}/comments", "comments.xml"),
+            (
+                "http://schemas.microsoft.com/office/"
+                "2011/relationships/commentsExtended",
+                "commentsExtended.xml",
+            ),
+        ]
+        for rel_type, target in comment_rels:
+            etree.SubElement(
+                rels,
+                "Relationship",
+                Id=f"rId{next_id}",
+                Type=rel_type,
+                Target=target,
+            )
+            next_id += 1
+
+    if has_numbering:
+        for suffix in ("numbering", "styles"):
+            etree.SubElement(
+                rels,
+                "Relationship",
+                Id=f"rId{next_id}",
+                Type=f"{rel_base}/{suffix}",
+                Target=f"{suffix}.xml",
+            )
+            next_id += 1
+
+    section_rids = []
+    for rel_type, target in section_rels:
+        rid = f"rId{next_id}"
+        next_id += 1
+        etree.SubElement(
+            rels,
+            "Relationship",
+            Id=rid,
+            Type=rel_type,
+            Target=target,
+        )
+        section_rids.append(rid)
+
+    for suffix in (
+        "settings",
+        "webSettings",
+        "footnotes",
+        "endnotes",
+        "fontTable",
+    ):
+        etree.SubElement(
+            rels,
+            "Relationship",
+            Id=f"rId{next_id}",
+            Type=f"{rel_base}/{suffix}",
+            Target=f"{suffix}.xml",
+        )
+        next_id += 1
+
+    etree.SubElement(
+        rels,
+        "Relationship",
+        Id=f"rId{next_id}",
+        Type=f"{rel_base}/theme",
+        Target="theme/theme1.xml",
+    )
+
+    return xml_to_bytes(rels), tuple(section_rids)
+
+
+_PACKAGE_RELS = PACKAGE_RELS_XML.encode("utf-8")
 
 
 class DocumentGenerator:
@@ -86,19 +346,28 @@ class DocumentGenerator:
                 for reply in comment.replies:
                     reply.date = ref
 
-    def generate(self, output_path: str | Path) -> None:
-        """Generate a .docx file at the specified path."""
+    def generate(
+        self, output_path: str | Path, compresslevel: int = 1
+    ) -> None:
+        """Generate a .docx file at the specified path.
+
+        ``compresslevel`` is the deflate level (0-9) used for the XML
+        parts. The default favours speed; pass 6 or 9 for smaller files.
+        """
         output_path = Path(output_path)
 
-        has_comments = any(
-            p.comments for p in self.spec.paragraphs
-        )
-        has_numbering = any(
-            p.numbering for p in self.spec.paragraphs
-        )
-        has_heading_numbering = any(
-            p.heading_level for p in self.spec.paragraphs
-        )
+        has_comments = False
+        has_numbering = False
+        has_heading_numbering = False
+        for para in self.spec.paragraphs:
+            if para.comments:
+                has_comments = True
+            if para.numbering:
+                has_numbering = True
+            if para.heading_level:
+                has_heading_numbering = True
+            if has_comments and has_numbering and has_heading_numbering:
+                break
         needs_numbering = has_numbering or has_heading_numbering
 
         # Build rels (populates _section_refs with rIds)
@@ -106,25 +375,41 @@ class DocumentGenerator:
             has_comments, needs_numbering
         )
 
+        # The archive is assembled in memory before touching disk, then
+        # written out with a single call.
+        buffer = io.BytesIO()
         with zipfile.ZipFile(
-            output_path, "w", zipfile.ZIP_DEFLATED
+            buffer,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            compresslevel=compresslevel,
         ) as docx_zip:
+            # The package manifests are tiny; storing them skips the
+            # deflate setup cost for almost no size penalty.
             docx_zip.writestr(
                 "[Content_Types].xml",
                 self._create_content_types(
                     has_comments, needs_numbering
                 ),
+                compress_type=zipfile.ZIP_STORED,
             )
             docx_zip.writestr(
-                "_rels/.rels", self._create_rels()
-            )
-            docx_zip.writestr(
-                "word/_rels/document.xml.rels", doc_rels
+                "_rels/.rels",
+                self._create_rels(),
+                compress_type=zipfile.ZIP_STORED,
             )
             docx_zip.writestr(
-                "word/document.xml",
-                self._create_document(),
-            )
+                "word/_rels/document.xml.rels",
+                doc_rels,
+                compress_type=zipfile.ZIP_STORED,
+            )
+            # Serialize the body straight into its archive entry rather
+            # than through an intermediate bytes object.
+            document = etree.ElementTree(self._build_document())
+            with docx_zip.open("word/document.xml", "w") as part:
+                document.write(
+                    part, xml_declaration=True, encoding="UTF-8"
+                )
             docx_zip.writestr(
                 "word/settings.xml",
                 create_settings(self._section_layout),
@@ -206,190 +491,28 @@ class DocumentGenerator:
                     ),
                 )
 
+        output_path.write_bytes(buffer.getbuffer())
+
     def _create_content_types(
         self,
         has_comments: bool = False,
         has_numbering: bool = False,
     ) -> bytes:
         """Create [Content_Types].xml."""
-        types = etree.Element(
-            "Types",
-            xmlns=(
-                "http://schemas.openxmlformats.org/"
-                "package/2006/content-types"
-            ),
-        )
-        etree.SubElement(
-            types,
-            "Default",
-            Extension="rels",
-            ContentType=(
-                "application/vnd.openxmlformats-package"
-                ".relationships+xml"
-            ),
-        )
-        etree.SubElement(
-            types,
-            "Default",
-            Extension="xml",
-            ContentType="application/xml",
-        )
-        etree.SubElement(
-            types,
-            "Override",
-            PartName="/word/document.xml",
-            ContentType=(
-                "application/vnd.openxmlformats-officedocument."
-                "wordprocessingml.document.main+xml"
-            ),
-        )
-
-        if has_comments:
-            for part_name, suffix in (
-                ("/word/comments.xml", "comments"),
-                (
-                    "/word/commentsExtended.xml",
-                    "commentsExtended",
-                ),
-            ):
-                etree.SubElement(
-                    types,
-                    "Override",
-                    PartName=part_name,
-                    ContentType=(
-                        "application/vnd.openxmlformats"
-                        "-officedocument.wordprocessingml."
-                        f"{suffix}+xml"
-                    ),
-                )
-
-        if has_numbering:
-            for part_name, suffix in (
-                ("/word/numbering.xml", "numbering"),
-                ("/word/styles.xml", "styles"),
-            ):
-                etree.SubElement(
-                    types,
-                    "Override",
-                    PartName=part_name,
-                    ContentType=(
-                        "application/vnd.openxmlformats"
-                        "-officedocument.wordprocessingml."
-                        f"{suffix}+xml"
-                    ),
-                )
-
-        for part in self._section_manifest:
-            etree.SubElement(
-                types,
-                "Override",
-                PartName=(
-                    f"/word/{part['path'].split('/', 1)[1]}"
-                ),
-                ContentType=part["content_type"],
+        section_overrides = tuple(
+            (
+                f"/word/{part['path'].split('/', 1)[1]}",
+                part["content_type"],
             )
-
-        # Standard parts
-        standard_parts = [
-            ("/word/settings.xml", "settings"),
-            ("/word/webSettings.xml", "webSettings"),
-            ("/word/footnotes.xml", "footnotes"),
-            ("/word/endnotes.xml", "endnotes"),
-            ("/word/fontTable.xml", "fontTable"),
-        ]
-        for part_name, suffix in standard_parts:
-            etree.SubElement(
-                types,
-                "Override",
-                PartName=part_name,
-                ContentType=(
-                    "application/vnd.openxmlformats"
-                    "-officedocument.wordprocessingml."
-                    f"{suffix}+xml"
-                ),
-            )
-
-        etree.SubElement(
-            types,
-            "Override",
-            PartName="/word/theme/theme1.xml",
-            ContentType=(
-                "application/vnd.openxmlformats-officedocument."
-                "theme+xml"
-            ),
+            for part in self._section_manifest
         )
-        etree.SubElement(
-            types,
-            "Override",
-            PartName="/docProps/core.xml",
-            ContentType=(
-                "application/vnd.openxmlformats-package"
-                ".core-properties+xml"
-            ),
-        )
-        etree.SubElement(
-            types,
-            "Override",
-            PartName="/docProps/app.xml",
-            ContentType=(
-                "application/vnd.openxmlformats-officedocument."
-                "extended-properties+xml"
-            ),
-        )
-
-        return etree.tostring(
-            types,
-            xml_declaration=True,
-            encoding="UTF-8",
-            pretty_print=True,
+        return _build_content_types(
+            has_comments, has_numbering, section_overrides
         )
 
     def _create_rels(self) -> bytes:
         """Create _rels/.rels."""
-        rels = etree.Element(
-            "Relationships",
-            xmlns=(
-                "http://schemas.openxmlformats.org/"
-                "package/2006/relationships"
-            ),
-        )
-        rel_base = (
-            "http://schemas.openxmlformats.org/"
-            "officeDocument/2006/relationships"
-        )
-        pkg_base = (
-            "http://schemas.openxmlformats.org/"
-            "package/2006/relationships"
-        )
-        etree.SubElement(
-            rels,
-            "Relationship",
-            Id="rId1",
-            Type=f"{rel_base}/officeDocument",
-            Target="word/document.xml",
-        )
-        etree.SubElement(
-            rels,
-            "Relationship",
-            Id="rId2",
-            Type=(
-                f"{pkg_base}/metadata/core-properties"
-            ),
-            Target="docProps/core.xml",
-        )
-        etree.SubElement(
-            rels,
-            "Relationship",
-            Id="rId3",
-            Type=f"{rel_base}/extended-properties",
-            Target="docProps/app.xml",
-        )
-        return etree.tostring(
-            rels,
-            xml_declaration=True,
-            encoding="UTF-8",
-            pretty_print=True,
-        )
+        return _PACKAGE_RELS
 
     def _create_document_rels(
         self,
@@ -397,110 +520,30 @@ class DocumentGenerator:
         has_numbering: bool = False,
     ) -> bytes:
         """Create word/_rels/document.xml.rels."""
-        rel_base = (
-            "http://schemas.openxmlformats.org/"
-            "officeDocument/2006/relationships"
-        )
-        rels = etree.Element(
-            "Relationships",
-            xmlns=(
-                "http://schemas.openxmlformats.org/"
-                "package/2006/relationships"
+        manifest = self._section_manifest
+        doc_rels, section_rids = _build_document_rels(
+            has_comments,
+            has_numbering,
+            tuple(
+                (part["relationship_type"], part["target"])
+                for part in manifest
             ),
         )
-
-        next_id = 1
-
-        if has_comments:
-            comment_rels = [
-                (f"{rel_base}/comments", "comments.xml"),
-                (
-                    "http://schemas.microsoft.com/office/"
-                    "2011/relationships/commentsExtended",
-                    "commentsExtended.xml",
-                ),
-            ]
-            for rel_type, target in comment_rels:
-                etree.SubElement(
-                    rels,
-                    "Relationship",
-                    Id=f"rId{next_id}",
-                    Type=rel_type,
-                    Target=target,
-                )
-                next_id += 1
-
-        if has_numbering:
-            for suffix in ("numbering", "styles"):
-                etree.SubElement(
-                    rels,
-                    "Relationship",
-                    Id=f"rId{next_id}",
-                    Type=f"{rel_base}/{suffix}",
-                    Target=f"{suffix}.xml",
-                )
-                next_id += 1
-
-        for part in self._section_manifest:
-            rid = f"rId{next_id}"
-            next_id += 1
-            etree.SubElement(
-                rels,
-                "Relationship",
-                Id=rid,
-                Type=part["relationship_type"],
-                Target=part["target"],
-            )
+        for part, rid in zip(manifest, section_rids, strict=True):
             si = part["section_index"]
             self._section_refs[si][part["kind"]][
                 part["variant"]
             ] = rid
+        return doc_rels
 
-        for suffix in (
-            "settings",
-            "webSettings",
-            "footnotes",
-            "endnotes",
-            "fontTable",
-        ):
-            etree.SubElement(
-                rels,
-                "Relationship",
-                Id=f"rId{next_id}",
-                Type=f"{rel_base}/{suffix}",
-                Target=f"{suffix}.xml",
-            )
-            next_id += 1
-
-        etree.SubElement(
-            rels,
-            "Relationship",
-            Id=f"rId{next_id}",
-            Type=f"{rel_base}/theme",
-            Target="theme/theme1.xml",
-        )
-
-        return etree.tostring(
-            rels,
-            xml_declaration=True,
-            encoding="UTF-8",
-            pretty_print=True,
-        )
-
-    def _create_document(self) -> bytes:
-        """Create word/document.xml with paragraphs."""
+    def _build_document(self) -> XMLElement:
+        """Build the word/document.xml tree with paragraphs."""
         document = etree.Element(
-            f"{{{NAMESPACES['w']}}}document",
+            W_DOCUMENT,
+            {MC_IGNORABLE_ATTR: MC_IGNORABLE},
             nsmap=WORD_NAMESPACES,
         )
-        document.set(
-            f"{{{NAMESPACES['mc']}}}Ignorable",
-            "w14 w15 w16se w16cid w16 w16cex"
-            " w16sdtdh w16sdtfl w16du wp14",
-        )
-        body = etree.SubElement(
-            document, f"{{{NAMESPACES['w']}}}body"
-        )
+        body = etree.SubElement(document, W_BODY)
 
         sections = self._section_layout
         paragraph_count = len(self.spec.paragraphs)
@@ -514,14 +557,16 @@ class DocumentGenerator:
                 section_starts[idx + 1] - 1
             ] = sections[idx]
 
+        add_paragraph = self._add_paragraph
         for para_index, para_spec in enumerate(
             self.spec.paragraphs
         ):
-            para = self._add_paragraph(body, para_spec)
-            if para_index in boundary_to_section:
+            para = add_paragraph(body, para_spec)
+            section = boundary_to_section.get(para_index)
+            if section is not None:
                 add_section_properties(
                     para,
-                    boundary_to_section[para_index],
+                    section,
                     self._section_layout,
                     self._section_refs,
                     is_body_level=False,
@@ -535,62 +580,44 @@ class DocumentGenerator:
             is_body_level=True,
         )
 
-        return etree.tostring(
-            document,
-            xml_declaration=True,
-            encoding="UTF-8",
-            pretty_print=True,
-        )
+        return document
 
     def _add_paragraph(
         self, body: XMLElement, para_spec: Paragraph
     ) -> XMLElement:
         """Add a paragraph to the body."""
-        w_ns = NAMESPACES["w"]
-        w14_ns = NAMESPACES["w14"]
-        para = etree.SubElement(body, f"{{{w_ns}}}p")
-
-        para_id = self._ctx.generate_hex_id(8)
-        para.set(f"{{{w14_ns}}}paraId", para_id)
-        para.set(f"{{{w14_ns}}}textId", "77777777")
+        sub_element = etree.SubElement
+        para = sub_element(
+            body,
+            W_P,
+            {
+                W14_PARA_ID: self._ctx.generate_hex_id(8),
+                W14_TEXT_ID: STATIC_TEXT_ID,
+            },
+        )
 
         if para_spec.numbering:
-            p_pr = etree.SubElement(
-                para, f"{{{w_ns}}}pPr"
-            )
-            p_style = etree.SubElement(
-                p_pr, f"{{{w_ns}}}pStyle"
-            )
-            p_style.set(
-                f"{{{w_ns}}}val", "ListParagraph"
-            )
-            num_pr = etree.SubElement(
-                p_pr, f"{{{w_ns}}}numPr"
-            )
-            ilvl = etree.SubElement(
-                num_pr, f"{{{w_ns}}}ilvl"
+            p_pr = sub_element(para, W_PPR)
+            sub_element(
+                p_pr, W_PSTYLE, {W_VAL: "ListParagraph"}
             )
-            ilvl.set(
-                f"{{{w_ns}}}val",
-                str(para_spec.numbering.level),
+            num_pr = sub_element(p_pr, W_NUMPR)
+            sub_element(
+                num_pr,
+                W_ILVL,
+                {W_VAL: str(para_spec.numbering.level)},
             )
-            num_id = etree.SubElement(
-                num_pr, f"{{{w_ns}}}numId"
-            )
-            num_id.set(
-                f"{{{w_ns}}}val",
-                str(para_spec.numbering.numbering_id),
+            sub_element(
+                num_pr,
+                W_NUMID,
+                {W_VAL: str(para_spec.numbering.numbering_id)},
             )
         elif para_spec.heading_level:
-            p_pr = etree.SubElement(
-                para, f"{{{w_ns}}}pPr"
-            )
-            p_style = etree.SubElement(
-                p_pr, f"{{{w_ns}}}pStyle"
-            )
-            p_style.set(
-                f"{{{w_ns}}}val",
-                f"Heading{para_spec.heading_level}",
+            p_pr = sub_element(para, W_PPR)
+            sub_element(
+                p_pr,
+                W_PSTYLE,
+                {W_VAL: f"Heading{para_spec.heading_level}"},
             )
 
         if (
@@ -609,13 +636,9 @@ class DocumentGenerator:
                 para, para_spec, self._ctx
             )
         else:
-            run = etree.SubElement(
-                para, f"{{{w_ns}}}r"
-            )
-            text_elem = etree.SubElement(
-                run, f"{{{w_ns}}}t"
-            )
-            text_elem.text = para_spec.text
+            sub_element(
+                sub_element(para, W_R), W_T
+            ).text = para_spec.text
 
         return para
 
@@ -623,3 +646,42 @@ class DocumentGenerator:
     def _generate_hex_id(self, length: int = 8) -> str:
         """Generate a random hexadecimal ID."""
         return self._ctx.generate_hex_id(length)
+
+
+def _generate_job(job: tuple[DocumentSpec, str | Path, int]) -> None:
+    """Generate one document; module-level so worker processes can run it."""
+    spec, output_path, compresslevel = job
+    DocumentGenerator(spec).generate(output_path, compresslevel=compresslevel)
+
+
+def generate_many(
+    jobs: Iterable[tuple[DocumentSpec, str | Path]],
+    max_workers: int | None = None,
+    compresslevel: int = 1,
+) -> None:
+    """Generate several .docx files in parallel worker processes.
+
+    Each job is a ``(spec, output_path)`` pair. Generation is CPU-bound
+    Python, so independent documents are spread across a process pool;
+    ``max_workers`` defaults to the number of CPUs. The first exception
+    raised by any job is re-raised here. The caller's specs are never
+    modified, whichever path runs. ``compresslevel`` is passed to
+    :meth:`DocumentGenerator.generate` for every job.
+
+    On platforms that start workers with ``spawn`` (macOS, Windows), the
+    calling script must guard its entry point with
+    ``if __name__ == "__main__":`` or each worker re-runs it on import.
+    """
+    jobs = list(jobs)
+    if max_workers == 1 or len(jobs) <= 1:
+        # Not worth starting a pool for a single document. DocumentGenerator
+        # pins default datetimes on seeded specs in place; workers only see
+        # pickled copies, so copy here to leave the caller's specs alone.
+        for spec, output_path in jobs:
+            _generate_job((copy.deepcopy(spec), output_path, compresslevel))
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        work = [(spec, path, compresslevel) for spec, path in jobs]
+        for _ in pool.map(_generate_job, work):
+            pass
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +10,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from docxfix.spec import (
     ChangeType,
     Comment,
@@ -38,6 +44,16 @@ class SpecParseError(Exception):
         )
 
 
+# String value -> enum member lookups for the enum-typed spec fields
+_CHANGE_TYPES = {ct.value: ct for ct in ChangeType}
+_ORIENTATIONS = {o.value: o for o in PageOrientation}
+
+
+def _field_path(path: str, key: str) -> str:
+    """Join a parent path and a key into a dotted field path."""
+    return f"{path}.{key}" if path else key
+
+
 def _require(
     data: dict[str, Any],
     key: str,
@@ -46,14 +62,17 @@ def _require(
     errors: list[tuple[str, str]],
 ) -> Any | None:
     """Validate that *key* exists in *data* and has the right type."""
-    field_path = f"{path}.{key}" if path else key
+    # The field path is only needed for error messages, so build it lazily.
     if key not in data:
-        errors.append((field_path, "required field is missing"))
+        errors.append((_field_path(path, key), "required field is missing"))
         return None
     val = data[key]
     if not isinstance(val, expected_type):
         errors.append(
-            (field_path, f"expected {expected_type.__name__}, got {type(val).__name__}")
+            (
+                _field_path(path, key),
+                f"expected {expected_type.__name__}, got {type(val).__name__}",
+            )
         )
         return None
     return val
@@ -70,11 +89,13 @@ def _optional(
     """Validate an optional field if present."""
     if key not in data:
         return default
-    field_path = f"{path}.{key}" if path else key
     val = data[key]
     if not isinstance(val, expected_type):
         errors.append(
-            (field_path, f"expected {expected_type.__name__}, got {type(val).__name__}")
+            (
+                _field_path(path, key),
+                f"expected {expected_type.__name__}, got {type(val).__name__}",
+            )
         )
         return default
     return val
@@ -131,11 +152,12 @@ def _parse_comment(
     date = _parse_datetime(date_str, f"{path}.date", errors) if date_str else None
 
     replies: list[CommentReply] = []
+    add_reply = replies.append
     raw_replies = _optional(data, "replies", path, list, errors, [])
     for i, reply_data in enumerate(raw_replies):
         reply = _parse_comment_reply(reply_data, f"{path}.replies[{i}]", errors)
         if reply is not None:
-            replies.append(reply)
+            add_reply(reply)
 
     return Comment(
         text=text,
@@ -161,13 +183,14 @@ def _parse_tracked_change(
     if text is None or change_type_str is None:
         return None
 
-    field_path = f"{path}.change_type"
-    try:
-        change_type = ChangeType(change_type_str)
-    except ValueError:
-        valid = ", ".join(f"'{ct.value}'" for ct in ChangeType)
+    change_type = _CHANGE_TYPES.get(change_type_str)
+    if change_type is None:
+        valid = ", ".join(f"'{value}'" for value in _CHANGE_TYPES)
         errors.append(
-            (field_path, f"invalid change type {change_type_str!r}; expected {valid}")
+            (
+                f"{path}.change_type",
+                f"invalid change type {change_type_str!r}; expected {valid}",
+            )
         )
         return None
 
@@ -220,19 +243,21 @@ def _parse_paragraph(
 
     # Parse tracked changes
     tracked_changes: list[TrackedChange] = []
+    add_change = tracked_changes.append
     raw_tc = _optional(data, "tracked_changes", path, list, errors, [])
     for i, tc_data in enumerate(raw_tc):
         tc = _parse_tracked_change(tc_data, f"{path}.tracked_changes[{i}]", errors)
         if tc is not None:
-            tracked_changes.append(tc)
+            add_change(tc)
 
     # Parse comments
     comments: list[Comment] = []
+    add_comment = comments.append
     raw_comments = _optional(data, "comments", path, list, errors, [])
     for i, c_data in enumerate(raw_comments):
         c = _parse_comment(c_data, f"{path}.comments[{i}]", errors)
         if c is not None:
-            comments.append(c)
+            add_comment(c)
 
     # Parse numbering
     numbering = None
@@ -282,13 +307,14 @@ def _parse_section(
     )
 
     orientation_str = _optional(data, "orientation", path, str, errors, "portrait")
-    field_path = f"{path}.orientation"
-    try:
-        orientation = PageOrientation(orientation_str)
-    except ValueError:
-        valid = ", ".join(f"'{o.value}'" for o in PageOrientation)
+    orientation = _ORIENTATIONS.get(orientation_str)
+    if orientation is None:
+        valid = ", ".join(f"'{value}'" for value in _ORIENTATIONS)
         errors.append(
-            (field_path, f"invalid orientation {orientation_str!r}; expected {valid}")
+            (
+                f"{path}.orientation",
+                f"invalid orientation {orientation_str!r}; expected {valid}",
+            )
         )
         orientation = PageOrientation.PORTRAIT
 
@@ -330,10 +356,13 @@ def _parse_spec_dict(data: Any) -> DocumentSpec:
     if raw_paragraphs is not None:
         if len(raw_paragraphs) == 0:
             errors.append(("$.paragraphs", "must contain at least one paragraph"))
+        # Local bindings: this loop runs once per paragraph in the spec.
+        parse_paragraph = _parse_paragraph
+        add_paragraph = paragraphs.append
         for i, p_data in enumerate(raw_paragraphs):
-            p = _parse_paragraph(p_data, f"$.paragraphs[{i}]", errors)
+            p = parse_paragraph(p_data, f"$.paragraphs[{i}]", errors)
             if p is not None:
-                paragraphs.append(p)
+                add_paragraph(p)
 
     # Parse sections (optional)
     sections: list[SectionSpec] = []
@@ -357,35 +386,23 @@ def _parse_spec_dict(data: Any) -> DocumentSpec:
     return spec
 
 
-def parse_spec_file(path: str | Path) -> DocumentSpec:
-    """Parse a JSON or YAML fixture spec file into a DocumentSpec.
-
-    The file format is determined by extension:
-    - ``.json`` → JSON
-    - ``.yaml`` / ``.yml`` → YAML
+@functools.lru_cache(maxsize=32)
+def _load_spec_bytes(raw: bytes, suffix: str) -> Any:
+    """Decode spec file contents; cached on the exact bytes and extension.
 
-    Raises:
-        SpecParseError: If the spec has validation errors (with field paths).
-        FileNotFoundError: If the file does not exist.
-        ValueError: If the file extension is unsupported.
+    Only the decoded mapping is cached. ``_parse_spec_dict`` never mutates
+    it, so every caller still gets a freshly built DocumentSpec.
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Spec file not found: {path}")
-
-    text = path.read_text(encoding="utf-8")
-    suffix = path.suffix.lower()
-
     if suffix == ".json":
         try:
-            data = json.loads(text)
+            data = json.loads(raw)
         except json.JSONDecodeError as exc:
             raise SpecParseError(
                 [("$", f"invalid JSON: {exc.args[0]}")]
             ) from exc
     elif suffix in (".yaml", ".yml"):
         try:
-            data = yaml.safe_load(text)
+            data = yaml.load(raw, Loader=_YamlLoader)
         except yaml.YAMLError as exc:
             raise SpecParseError(
                 [("$", f"invalid YAML: {exc}")]
@@ -395,7 +412,30 @@ def parse_spec_file(path: str | Path) -> DocumentSpec:
             f"Unsupported file extension {suffix!r}; expected .json, .yaml, or .yml"
         )
 
-    return _parse_spec_dict(data)
+    return data
+
+
+def parse_spec_file(path: str | Path) -> DocumentSpec:
+    """Parse a JSON or YAML fixture spec file into a DocumentSpec.
+
+    The file format is determined by extension:
+    - ``.json`` → JSON
+    - ``.yaml`` / ``.yml`` → YAML
+
+    Raises:
+        SpecParseError: If the spec has validation errors (with field paths).
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file extension is unsupported.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Spec file not found: {path}")
+
+    # Both parsers accept bytes and decode UTF-8 themselves.
+    raw = path.read_bytes()
+    # Fixtures are often loaded repeatedly, so decoding is cached on the
+    # file contents; the spec itself is rebuilt on every call.
+    return _parse_spec_dict(_load_spec_bytes(raw, path.suffix.lower()))
 
 
 def parse_spec_string(text: str, *, format: str = "yaml") -> DocumentSpec:
@@ -418,7 +458,7 @@ def parse_spec_string(text: str, *, format: str = "yaml") -> DocumentSpec:
             ) from exc
     elif format == "yaml":
         try:
-            data = yaml.safe_load(text)
+            data = yaml.load(text, Loader=_YamlLoader)
         except yaml.YAMLError as exc:
             raise SpecParseError(
                 [("$", f"invalid YAML: {exc}")]
@@ -12,7 +12,7 @@ class ChangeType(Enum):
     DELETION = "deletion"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedChange:
     """Specification for a tracked change (insertion or deletion).
 
@@ -28,48 +28,48 @@ class TrackedChange:
     change_type: ChangeType
     text: str
     author: str = "Test User"
-    date: datetime | None = None
+    date: datetime | None = field(default_factory=datetime.now)
     revision_id: int = 1
     insert_after: str = ""
 
     def __post_init__(self) -> None:
-        """Set default date if not provided."""
+        """Fill in the date when ``None`` is passed explicitly."""
         if self.date is None:
             self.date = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class CommentReply:
     """Specification for a comment reply."""
 
     text: str
     author: str = "Test User"
-    date: datetime | None = None
+    date: datetime | None = field(default_factory=datetime.now)
 
     def __post_init__(self) -> None:
-        """Set default date if not provided."""
+        """Fill in the date when ``None`` is passed explicitly."""
         if self.date is None:
             self.date = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """Specification for a modern threaded comment."""
 
     text: str
     anchor_text: str
     author: str = "Test User"
-    date: datetime | None = None
+    date: datetime | None = field(default_factory=datetime.now)
     replies: list[CommentReply] = field(default_factory=list)
     resolved: bool = False
 
     def __post_init__(self) -> None:
-        """Set default date if not provided."""
+        """Fill in the date when ``None`` is passed explicitly."""
         if self.date is None:
             self.date = datetime.now()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumberingLevel:
     """Specification for a numbering level."""
 
@@ -78,7 +78,7 @@ class NumberingLevel:
     start: int = 1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumberedParagraph:
     """Specification for numbering properties of a paragraph."""
 
@@ -93,7 +93,7 @@ class PageOrientation(Enum):
     LANDSCAPE = "landscape"
 
 
-@dataclass
+@dataclass(slots=True)
 class HeaderFooterSet:
     """Section header/footer text variants."""
 
@@ -102,7 +102,7 @@ class HeaderFooterSet:
     even: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionSpec:
     """Specification for a section starting at a paragraph index."""
 
@@ -122,7 +122,7 @@ class SectionSpec:
             raise ValueError("page_number_start must be >= 1")
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """Specification for a paragraph in the document."""
 
@@ -133,7 +133,7 @@ class Paragraph:
     heading_level: int | None = None  # 1-4 → Heading1-Heading4
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentSpec:
     """Top-level specification for a docx fixture."""
 
@@ -1,10 +1,50 @@
 """Validation utilities for generated .docx files."""
 
 import zipfile
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from lxml import etree
 
+from docxfix.constants import NAMESPACES
+
+W_NS = NAMESPACES["w"]
+R_NS = NAMESPACES["r"]
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+# Prefix map for the validator's XPath queries
+_NS = {"w": W_NS, "r": R_NS}
+
+# Clark-notation names used by the checks
+R_ID = f"{{{R_NS}}}id"
+REL_RELATIONSHIP = f"{{{REL_NS}}}Relationship"
+CT_DEFAULT = f"{{{CT_NS}}}Default"
+CT_OVERRIDE = f"{{{CT_NS}}}Override"
+
+# Parts never use xml:id or entities, so skip the ID table and DTD work
+_PARSER = etree.XMLParser(
+    collect_ids=False, resolve_entities=False, no_network=True
+)
+
+
+class _NullTarget:
+    """Parser target that discards all events, so no tree is built."""
+
+    def close(self) -> None:
+        return None
+
+
+# Same options, but parse events go nowhere: checks syntax only
+_CHECK_PARSER = etree.XMLParser(
+    target=_NullTarget(),
+    collect_ids=False,
+    resolve_entities=False,
+    no_network=True,
+)
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -21,9 +61,40 @@ class DocumentValidator:
         "word/document.xml",
     ]
 
+    # Parts the semantic checks read; parsed once and kept for reuse
+    CACHED_PARTS = frozenset(
+        {
+            "[Content_Types].xml",
+            "word/document.xml",
+            "word/_rels/document.xml.rels",
+            "word/comments.xml",
+        }
+    )
+
+    # Compiled once at import; the ID queries return attribute strings
+    # directly instead of elements.
+    _XPATH_HDRFTR_REFS = etree.XPath(
+        "//w:sectPr/w:headerReference | //w:sectPr/w:footerReference",
+        namespaces=_NS,
+    )
+    _XPATH_COMMENT_IDS = etree.XPath("w:comment/@w:id", namespaces=_NS)
+    _XPATH_CHANGE_IDS = etree.XPath(
+        "//w:ins/@w:id | //w:del/@w:id", namespaces=_NS
+    )
+    _XPATH_RANGE_START_IDS = etree.XPath(
+        "//w:commentRangeStart/@w:id", namespaces=_NS
+    )
+    _XPATH_RANGE_END_IDS = etree.XPath(
+        "//w:commentRangeEnd/@w:id", namespaces=_NS
+    )
+    _XPATH_RIDS = etree.XPath("//@r:id", namespaces=_NS)
+
     def __init__(self, docx_path: str | Path) -> None:
         """Initialize validator with path to .docx file."""
         self.docx_path = Path(docx_path)
+        self._zip: zipfile.ZipFile | None = None
+        self._trees: dict[str, etree._Element] = {}
+        self._rels: dict[str | None, etree._Element] | None = None
 
     def validate(self) -> None:
         """Validate the .docx file.
@@ -32,13 +103,52 @@ class DocumentValidator:
             ValidationError: If validation fails
         """
         self._validate_zip_structure()
-        self._validate_xml_wellformedness()
-        self._validate_section_header_footer_integrity()
-        self._validate_comment_id_uniqueness()
-        self._validate_tracked_change_id_uniqueness()
-        self._validate_comment_anchor_integrity()
-        self._validate_relationship_completeness()
-        self._validate_content_type_coverage()
+        # Keep the archive open across the remaining checks so each part
+        # is inflated and parsed only once.
+        with self._open_zip():
+            self._validate_xml_wellformedness()
+            self._validate_section_header_footer_integrity()
+            self._validate_comment_id_uniqueness()
+            self._validate_tracked_change_id_uniqueness()
+            self._validate_comment_anchor_integrity()
+            self._validate_relationship_completeness()
+            self._validate_content_type_coverage()
+
+    @contextmanager
+    def _open_zip(self) -> Iterator[zipfile.ZipFile]:
+        """Yield the open archive, opening it if no caller already has."""
+        if self._zip is not None:
+            yield self._zip
+            return
+        with zipfile.ZipFile(self.docx_path, "r") as docx_zip:
+            self._zip = docx_zip
+            try:
+                yield docx_zip
+            finally:
+                self._zip = None
+                self._trees.clear()
+                self._rels = None
+
+    def _get_tree(self, name: str) -> etree._Element:
+        """Return the parsed root of a part, parsing it once per open."""
+        tree = self._trees.get(name)
+        if tree is None:
+            # Parse straight from the inflate stream so the part is never
+            # held in memory as one decompressed bytes object.
+            with self._zip.open(name) as stream:
+                tree = etree.parse(stream, _PARSER).getroot()
+            self._trees[name] = tree
+        return tree
+
+    def _get_rel_by_id(self) -> dict[str | None, etree._Element]:
+        """Return document.xml.rels relationships keyed by Id, built once."""
+        if self._rels is None:
+            rels_root = self._get_tree("word/_rels/document.xml.rels")
+            self._rels = {
+                rel.get("Id"): rel
+                for rel in rels_root.findall(REL_RELATIONSHIP)
+            }
+        return self._rels
 
     def _validate_zip_structure(self) -> None:
         """Validate that required files exist in the ZIP."""
@@ -52,10 +162,9 @@ class DocumentValidator:
                 f"Not a valid ZIP file: {self.docx_path}"
             )
 
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
-            available = set(docx_zip.namelist())
+        with self._open_zip() as docx_zip:
+            # NameToInfo is already a dict keyed by part name
+            available = docx_zip.NameToInfo
             for req in self.REQUIRED_FILES:
                 if req not in available:
                     raise ValidationError(
@@ -64,133 +173,82 @@ class DocumentValidator:
 
     def _validate_xml_wellformedness(self) -> None:
         """Validate that XML files are well-formed."""
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
-            for filename in docx_zip.namelist():
-                if filename.endswith(
-                    ".xml"
-                ) or filename.endswith(".rels"):
-                    try:
-                        content = docx_zip.read(filename)
-                        etree.fromstring(content)
-                    except etree.XMLSyntaxError as e:
-                        raise ValidationError(
-                            f"XML syntax error in"
-                            f" {filename}: {e}"
-                        ) from e
+        with self._open_zip() as docx_zip:
+            targets = [
+                name
+                for name in docx_zip.namelist()
+                if name.endswith((".xml", ".rels"))
+            ]
+            for filename in targets:
+                try:
+                    if filename in self.CACHED_PARTS:
+                        # Later checks need this tree anyway
+                        self._get_tree(filename)
+                        continue
+                    # Stream the part into a no-op target: only
+                    # well-formedness matters here, so no tree is built,
+                    # and libxml2's own diagnostic reaches the message.
+                    with docx_zip.open(filename) as stream:
+                        etree.parse(stream, _CHECK_PARSER)
+                except etree.XMLSyntaxError as e:
+                    raise ValidationError(
+                        f"XML syntax error in {filename}: {e}"
+                    ) from e
 
     def _validate_section_header_footer_integrity(
         self,
     ) -> None:
         """Validate section references to header/footer parts."""
-        w_ns = (
-            "http://schemas.openxmlformats.org/"
-            "wordprocessingml/2006/main"
-        )
-        r_ns = (
-            "http://schemas.openxmlformats.org/"
-            "officeDocument/2006/relationships"
-        )
-        rel_ns = (
-            "http://schemas.openxmlformats.org/"
-            "package/2006/relationships"
-        )
-
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
-            doc_root = etree.fromstring(
-                docx_zip.read("word/document.xml")
-            )
-            rels_root = etree.fromstring(
-                docx_zip.read(
-                    "word/_rels/document.xml.rels"
+        with self._open_zip() as docx_zip:
+            doc_root = self._get_tree("word/document.xml")
+            available = docx_zip.NameToInfo
+            rel_by_id = self._get_rel_by_id()
+
+            for ref in self._XPATH_HDRFTR_REFS(doc_root):
+                tag = etree.QName(ref).localname
+                expected = (
+                    "header" if tag == "headerReference" else "footer"
                 )
-            )
-            available = set(docx_zip.namelist())
+                rid = ref.get(R_ID)
+                if not rid:
+                    raise ValidationError(
+                        f"Section {tag} is missing r:id"
+                    )
+                if rid not in rel_by_id:
+                    raise ValidationError(
+                        f"Section {tag} references"
+                        f" missing relationship: {rid}"
+                    )
 
-            rel_by_id = {
-                rel.get("Id"): rel
-                for rel in rels_root.findall(
-                    f"{{{rel_ns}}}Relationship"
-                )
-            }
+                rel = rel_by_id[rid]
+                rel_type = rel.get("Type", "")
+                if not rel_type.endswith(f"/{expected}"):
+                    raise ValidationError(
+                        f"Relationship {rid} type"
+                        f" mismatch for {tag}: {rel_type}"
+                    )
 
-            for sect_pr in doc_root.findall(
-                f".//{{{w_ns}}}sectPr"
-            ):
-                for tag, expected in (
-                    ("headerReference", "header"),
-                    ("footerReference", "footer"),
-                ):
-                    for ref in sect_pr.findall(
-                        f"{{{w_ns}}}{tag}"
-                    ):
-                        rid = ref.get(f"{{{r_ns}}}id")
-                        if not rid:
-                            raise ValidationError(
-                                f"Section {tag}"
-                                " is missing r:id"
-                            )
-                        if rid not in rel_by_id:
-                            raise ValidationError(
-                                f"Section {tag} references"
-                                f" missing relationship:"
-                                f" {rid}"
-                            )
-
-                        rel = rel_by_id[rid]
-                        rel_type = rel.get("Type", "")
-                        if not rel_type.endswith(
-                            f"/{expected}"
-                        ):
-                            raise ValidationError(
-                                f"Relationship {rid} type"
-                                f" mismatch for {tag}:"
-                                f" {rel_type}"
-                            )
-
-                        target = rel.get("Target")
-                        if not target:
-                            raise ValidationError(
-                                f"Relationship {rid}"
-                                " has no target"
-                            )
-                        target_path = (
-                            f"word/{target.lstrip('./')}"
-                        )
-                        if target_path not in available:
-                            raise ValidationError(
-                                f"Missing section part for"
-                                f" {rid}: {target_path}"
-                            )
+                target = rel.get("Target")
+                if not target:
+                    raise ValidationError(
+                        f"Relationship {rid} has no target"
+                    )
+                target_path = f"word/{target.lstrip('./')}"
+                if target_path not in available:
+                    raise ValidationError(
+                        f"Missing section part for"
+                        f" {rid}: {target_path}"
+                    )
 
     def _validate_comment_id_uniqueness(self) -> None:
         """Check that comment IDs in comments.xml are unique."""
-        w_ns = (
-            "http://schemas.openxmlformats.org/"
-            "wordprocessingml/2006/main"
-        )
-
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
-            if "word/comments.xml" not in docx_zip.namelist():
+        with self._open_zip() as docx_zip:
+            if "word/comments.xml" not in docx_zip.NameToInfo:
                 return
 
-            root = etree.fromstring(
-                docx_zip.read("word/comments.xml")
-            )
-            ids: list[str] = []
-            for comment in root.findall(
-                f"{{{w_ns}}}comment"
-            ):
-                cid = comment.get(f"{{{w_ns}}}id")
-                if cid is not None:
-                    ids.append(cid)
-
-            dupes = {x for x in ids if ids.count(x) > 1}
+            root = self._get_tree("word/comments.xml")
+            counts = Counter(self._XPATH_COMMENT_IDS(root))
+            dupes = {x for x, n in counts.items() if n > 1}
             if dupes:
                 raise ValidationError(
                     f"Duplicate comment IDs: {dupes}"
@@ -200,28 +258,11 @@ class DocumentValidator:
         self,
     ) -> None:
         """Check that tracked change IDs are unique."""
-        w_ns = (
-            "http://schemas.openxmlformats.org/"
-            "wordprocessingml/2006/main"
-        )
-
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
-            root = etree.fromstring(
-                docx_zip.read("word/document.xml")
-            )
-
-            ids: list[str] = []
-            for tag in ("ins", "del"):
-                for elem in root.findall(
-                    f".//{{{w_ns}}}{tag}"
-                ):
-                    tid = elem.get(f"{{{w_ns}}}id")
-                    if tid is not None:
-                        ids.append(tid)
+        with self._open_zip():
+            root = self._get_tree("word/document.xml")
 
-            dupes = {x for x in ids if ids.count(x) > 1}
+            counts = Counter(self._XPATH_CHANGE_IDS(root))
+            dupes = {x for x, n in counts.items() if n > 1}
             if dupes:
                 raise ValidationError(
                     "Duplicate tracked change IDs:"
@@ -230,32 +271,11 @@ class DocumentValidator:
 
     def _validate_comment_anchor_integrity(self) -> None:
         """Verify commentRangeStart/End pairs match."""
-        w_ns = (
-            "http://schemas.openxmlformats.org/"
-            "wordprocessingml/2006/main"
-        )
-
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
-            root = etree.fromstring(
-                docx_zip.read("word/document.xml")
-            )
+        with self._open_zip():
+            root = self._get_tree("word/document.xml")
 
-            starts = {
-                elem.get(f"{{{w_ns}}}id")
-                for elem in root.findall(
-                    f".//{{{w_ns}}}commentRangeStart"
-                )
-                if elem.get(f"{{{w_ns}}}id") is not None
-            }
-            ends = {
-                elem.get(f"{{{w_ns}}}id")
-                for elem in root.findall(
-                    f".//{{{w_ns}}}commentRangeEnd"
-                )
-                if elem.get(f"{{{w_ns}}}id") is not None
-            }
+            starts = set(self._XPATH_RANGE_START_IDS(root))
+            ends = set(self._XPATH_RANGE_END_IDS(root))
 
             if starts and starts != ends:
                 unmatched_starts = starts - ends
@@ -280,47 +300,18 @@ class DocumentValidator:
         self,
     ) -> None:
         """Verify every rId in document.xml exists in rels."""
-        r_ns = (
-            "http://schemas.openxmlformats.org/"
-            "officeDocument/2006/relationships"
-        )
-        rel_ns = (
-            "http://schemas.openxmlformats.org/"
-            "package/2006/relationships"
-        )
-
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
+        with self._open_zip() as docx_zip:
             if (
                 "word/_rels/document.xml.rels"
-                not in docx_zip.namelist()
+                not in docx_zip.NameToInfo
             ):
                 return
 
-            doc_root = etree.fromstring(
-                docx_zip.read("word/document.xml")
-            )
-            rels_root = etree.fromstring(
-                docx_zip.read(
-                    "word/_rels/document.xml.rels"
-                )
-            )
-
-            defined_ids = {
-                rel.get("Id")
-                for rel in rels_root.findall(
-                    f"{{{rel_ns}}}Relationship"
-                )
-                if rel.get("Id") is not None
-            }
+            doc_root = self._get_tree("word/document.xml")
+            defined_ids = self._get_rel_by_id().keys()
 
             # Find all r:id references in document.xml
-            referenced_ids: set[str] = set()
-            for elem in doc_root.iter():
-                rid = elem.get(f"{{{r_ns}}}id")
-                if rid is not None:
-                    referenced_ids.add(rid)
+            referenced_ids = set(self._XPATH_RIDS(doc_root))
 
             missing = referenced_ids - defined_ids
             if missing:
@@ -331,40 +322,27 @@ class DocumentValidator:
 
     def _validate_content_type_coverage(self) -> None:
         """Verify every ZIP part has a content type."""
-        with zipfile.ZipFile(
-            self.docx_path, "r"
-        ) as docx_zip:
-            ct_root = etree.fromstring(
-                docx_zip.read("[Content_Types].xml")
-            )
-
-            ct_ns = (
-                "http://schemas.openxmlformats.org/"
-                "package/2006/content-types"
-            )
+        with self._open_zip() as docx_zip:
+            ct_root = self._get_tree("[Content_Types].xml")
 
             # Collect Default extensions
-            default_exts = {
-                d.get("Extension")
-                for d in ct_root.findall(
-                    f"{{{ct_ns}}}Default"
-                )
-                if d.get("Extension") is not None
-            }
+            default_exts = frozenset(
+                ext
+                for d in ct_root.findall(CT_DEFAULT)
+                if (ext := d.get("Extension")) is not None
+            )
 
-            # Collect Override part names
-            override_parts = {
+            # Collect Override part names, normalized once up front
+            override_parts = frozenset(
                 o.get("PartName", "").lstrip("/")
-                for o in ct_root.findall(
-                    f"{{{ct_ns}}}Override"
-                )
-            }
+                for o in ct_root.findall(CT_OVERRIDE)
+            )
 
             for part_name in docx_zip.namelist():
                 # Skip rels directory files — they use
                 # the .rels Default extension
-                ext = part_name.rsplit(".", 1)[-1]
-                if ext in default_exts:
+                dot = part_name.rfind(".")
+                if dot != -1 and part_name[dot + 1 :] in default_exts:
                     continue
 
                 if part_name not in override_parts:
@@ -43,12 +43,9 @@ def add_child(
     Returns:
         The created child element
     """
-    child = etree.SubElement(parent, tag)
+    child = etree.SubElement(parent, tag, attrib=attributes or None)
     if text is not None:
         child.text = text
-    if attributes is not None:
-        for key, value in attributes.items():
-            child.set(key, value)
     return child
 
 
@@ -70,6 +67,28 @@ def xml_to_string(element: XMLElement, pretty_print: bool = True) -> str:
     )
 
 
+def xml_to_bytes(element: XMLElement, pretty_print: bool = False) -> bytes:
+    """
+    Serialize an XML element to UTF-8 bytes with an XML declaration.
+
+    Use this when writing a part to a file or zip archive; it skips the
+    decode/encode round-trip that ``xml_to_string`` would add.
+
+    Args:
+        element: The XML element to convert
+        pretty_print: Whether to format the output with indentation
+
+    Returns:
+        The XML document as bytes
+    """
+    return etree.tostring(
+        element,
+        xml_declaration=True,
+        encoding="UTF-8",
+        pretty_print=pretty_print,
+    )
+
+
 def parse_xml_string(xml_string: str) -> XMLElement:
     """
     Parse an XML string into an element.
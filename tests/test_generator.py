@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from lxml import etree
 
-from docxfix.generator import DocumentGenerator
+from docxfix.generator import DocumentGenerator, generate_many
 from docxfix.spec import ChangeType, Comment, CommentReply, DocumentSpec, TrackedChange
 
 
@@ -62,6 +62,95 @@ def test_generator_creates_valid_xml():
                     etree.fromstring(content)
 
 
+def test_generator_compresslevel_preserves_content():
+    """Test that the deflate level changes size but not part content."""
+    spec = DocumentSpec(seed=42)
+    for i in range(50):
+        spec.add_paragraph(f"Paragraph {i} with some repeated filler text.")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fast_path = Path(tmpdir) / "fast.docx"
+        small_path = Path(tmpdir) / "small.docx"
+        DocumentGenerator(spec).generate(fast_path)
+        DocumentGenerator(spec).generate(small_path, compresslevel=9)
+
+        with (
+            zipfile.ZipFile(fast_path) as fast_zip,
+            zipfile.ZipFile(small_path) as small_zip,
+        ):
+            assert fast_zip.namelist() == small_zip.namelist()
+            for name in fast_zip.namelist():
+                assert fast_zip.read(name) == small_zip.read(name)
+            assert (
+                small_zip.getinfo("word/document.xml").compress_size
+                <= fast_zip.getinfo("word/document.xml").compress_size
+            )
+
+
+def test_generate_many_matches_sequential_output():
+    """Test that pooled generation writes the same files as generate()."""
+    specs = []
+    for seed in (1, 2, 3):
+        spec = DocumentSpec(seed=seed)
+        spec.add_paragraph(f"Document {seed}")
+        specs.append(spec)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        jobs = [(spec, tmp / f"pooled{i}.docx") for i, spec in enumerate(specs)]
+        generate_many(jobs, max_workers=2)
+
+        for i, spec in enumerate(specs):
+            expected = tmp / f"direct{i}.docx"
+            DocumentGenerator(spec).generate(expected)
+            # Compare part contents; zip entry timestamps may differ
+            with (
+                zipfile.ZipFile(tmp / f"pooled{i}.docx") as pooled,
+                zipfile.ZipFile(expected) as direct,
+            ):
+                assert pooled.namelist() == direct.namelist()
+                for name in direct.namelist():
+                    assert pooled.read(name) == direct.read(name)
+
+
+def test_generate_many_leaves_caller_specs_unchanged():
+    """Test that in-process generation does not pin dates on caller specs."""
+    spec = DocumentSpec(seed=1)
+    change = TrackedChange(change_type=ChangeType.INSERTION, text="new")
+    spec.add_paragraph("Text", tracked_changes=[change])
+    original_date = change.date
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generate_many([(spec, Path(tmpdir) / "one.docx")], max_workers=1)
+
+    assert change.date == original_date
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_generate_many_passes_compresslevel(max_workers):
+    """Test that generate_many writes parts at the requested deflate level."""
+    specs = []
+    for seed in (1, 2):
+        spec = DocumentSpec(seed=seed)
+        for i in range(20):
+            spec.add_paragraph(f"Paragraph {i} with some repeated filler text.")
+        specs.append(spec)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = [Path(tmpdir) / f"stored{i}.docx" for i in range(len(specs))]
+        generate_many(
+            list(zip(specs, paths, strict=True)),
+            max_workers=max_workers,
+            compresslevel=0,
+        )
+
+        for path in paths:
+            with zipfile.ZipFile(path) as docx_zip:
+                info = docx_zip.getinfo("word/document.xml")
+                # Level 0 deflate does not shrink the part at all
+                assert info.compress_size >= info.file_size
+
+
 def test_generator_simple_paragraph():
     """Test generating a document with a simple paragraph."""
     spec = DocumentSpec()
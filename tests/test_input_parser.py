@@ -320,6 +320,42 @@ class TestFileParsing:
         finally:
             path.unlink()
 
+    def test_repeated_parse_returns_independent_specs(self):
+        path = _write_temp(MINIMAL_YAML, ".yaml")
+        try:
+            first = parse_spec_file(path)
+            first.paragraphs[0].text = "Changed"
+            second = parse_spec_file(path)
+            assert second is not first
+            assert second.paragraphs[0].text == "Hello world"
+        finally:
+            path.unlink()
+
+    def test_repeated_parse_fills_fresh_default_dates(self, monkeypatch):
+        content = (
+            "paragraphs:\n"
+            "  - text: Hello world\n"
+            "    comments:\n"
+            "      - text: Note\n"
+            "        anchor_text: Hello\n"
+        )
+        path = _write_temp(content, ".yaml")
+        try:
+            parse_spec_file(path)
+
+            fixed = datetime(2030, 1, 1, 12, 0, 0)
+
+            class _FixedDatetime(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return fixed
+
+            monkeypatch.setattr("docxfix.spec.datetime", _FixedDatetime)
+            second = parse_spec_file(path)
+            assert second.paragraphs[0].comments[0].date == fixed
+        finally:
+            path.unlink()
+
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError, match="not found"):
             parse_spec_file("/nonexistent/path.yaml")
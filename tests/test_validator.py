@@ -100,6 +100,35 @@ def test_validator_malformed_xml():
             validator.validate()
 
 
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("", "Document is empty"),
+        ("<styles>&nope;</styles>", "Entity 'nope' not defined"),
+    ],
+)
+def test_validator_malformed_uncached_part_reports_parser_error(
+    content: str, message: str
+):
+    """Syntax errors in parts outside the parse cache keep libxml2's text."""
+    spec = DocumentSpec()
+    spec.add_paragraph("Test paragraph")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "test.docx"
+        DocumentGenerator(spec).generate(output_path)
+
+        with zipfile.ZipFile(output_path, "a") as docx_zip:
+            docx_zip.writestr("word/extra.xml", content)
+
+        validator = DocumentValidator(output_path)
+
+        with pytest.raises(
+            ValidationError, match=f"XML syntax error in word/extra.xml: {message}"
+        ):
+            validator._validate_xml_wellformedness()
+
+
 def test_validator_all_files_wellformed():
     """Test that validator checks all XML files."""
     spec = DocumentSpec()
@@ -6,6 +6,7 @@ from docxfix.xml_utils import (
     add_child,
     create_simple_xml,
     parse_xml_string,
+    xml_to_bytes,
     xml_to_string,
 )
 
@@ -51,6 +52,15 @@ def test_xml_to_string():
     assert "<root>Content</root>" in xml_string
 
 
+def test_xml_to_bytes():
+    """Test serializing XML to UTF-8 bytes with a declaration."""
+    element = create_simple_xml("root", "Caf\u00e9")
+    xml_bytes = xml_to_bytes(element)
+
+    assert xml_bytes.startswith(b"<?xml version='1.0' encoding='UTF-8'?>")
+    assert xml_bytes.endswith("<root>Caf\u00e9</root>".encode())
+
+
 def test_xml_to_string_snapshot(snapshot: SnapshotAssertion):
     """Test XML to string conversion with snapshot."""
     root = create_simple_xml("document")